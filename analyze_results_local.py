@@ -21,10 +21,11 @@ Install with: pip install numpy matplotlib scikit-learn
 
 import os
 import json
+import functools
+import math
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import difflib
 
 # Original clean sentence
@@ -38,12 +39,22 @@ def get_local_embedding(texts: list) -> np.ndarray:
     """
     Get vector embeddings using TF-IDF (completely local, no API needed).
     
+    The vectorizer is fit on the texts themselves, so results are memoized
+    on tuple(texts): repeated calls with the same texts reuse the fitted
+    embeddings instead of rebuilding the vocabulary.
+    
     Args:
         texts: List of texts to embed
         
     Returns:
-        numpy array of embeddings
+        numpy array of embeddings (a fresh copy the caller may modify)
     """
+    return _fit_tfidf_embeddings(tuple(texts)).copy()
+
+
+@functools.lru_cache(maxsize=16)
+def _fit_tfidf_embeddings(texts: tuple) -> np.ndarray:
+    """Fit TF-IDF on a tuple of texts and return the dense embeddings."""
     # Use TF-IDF to create embeddings
     vectorizer = TfidfVectorizer(
         max_features=1000,
@@ -53,6 +64,8 @@ def get_local_embedding(texts: list) -> np.ndarray:
     )
     
     embeddings = vectorizer.fit_transform(texts).toarray()
+    # Cached arrays are shared between callers, so guard against mutation
+    embeddings.flags.writeable = False
     return embeddings
 
 
@@ -68,11 +81,43 @@ def calculate_cosine_distance(vec1: np.ndarray, vec2: np.ndarray) -> float:
     Returns:
         Float representing the cosine distance (0 = identical, 2 = opposite)
     """
-    vec1 = vec1.reshape(1, -1)
-    vec2 = vec2.reshape(1, -1)
-    similarity = cosine_similarity(vec1, vec2)[0][0]
+    # Always compute in float64 so results match cosine_distance_matrix
+    vec1 = np.ravel(np.asarray(vec1, dtype=np.float64))
+    vec2 = np.ravel(np.asarray(vec2, dtype=np.float64))
+    norm_product = math.sqrt(float(vec1 @ vec1)) * math.sqrt(float(vec2 @ vec2))
+    if norm_product == 0:
+        # A zero vector has no direction; treat it as dissimilar (similarity 0)
+        return 1.0
+    similarity = float(vec1 @ vec2) / norm_product
     distance = 1 - similarity
-    return distance
+    return min(max(distance, 0.0), 2.0)
+
+
+def cosine_distance_matrix(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """
+    Calculate cosine distances between every row of A and every row of B.
+    
+    Uses a single matrix product instead of one call per pair.
+    
+    Args:
+        A: Embeddings of shape (n, dim)
+        B: Embeddings of shape (m, dim)
+        
+    Returns:
+        numpy array of shape (n, m) where [i, j] is the distance from A[i] to B[j]
+    """
+    # float64 throughout, so identical rows get identical distances wherever
+    # they sit in the matrix
+    A = np.atleast_2d(np.asarray(A, dtype=np.float64))
+    B = np.atleast_2d(np.asarray(B, dtype=np.float64))
+    norms_a = np.sqrt(np.einsum('ij,ij->i', A, A))
+    norms_b = np.sqrt(np.einsum('ij,ij->i', B, B))
+    norm_products = np.outer(norms_a, norms_b)
+    
+    similarities = np.zeros(norm_products.shape)
+    np.divide(A @ B.T, norm_products, out=similarities, where=norm_products > 0)
+    # Guard against rounding outside [0, 2], as sklearn's cosine_distances does
+    return np.clip(1 - similarities, 0, 2)
 
 
 def calculate_text_similarity(text1: str, text2: str) -> float:
@@ -92,8 +137,8 @@ def calculate_word_overlap(text1: str, text2: str) -> float:
     Returns:
         Float between 0 and 1
     """
-    words1 = set(text1.lower().split())
-    words2 = set(text2.lower().split())
+    words1 = _tokenize(text1)
+    words2 = _tokenize(text2)
     
     if not words1 or not words2:
         return 0.0
@@ -104,6 +149,45 @@ def calculate_word_overlap(text1: str, text2: str) -> float:
     return intersection / union if union > 0 else 0.0
 
 
+@functools.lru_cache(maxsize=1024)
+def _tokenize(text: str) -> frozenset:
+    """
+    Split text into a set of lowercase words.
+    
+    Cached so the reference sentence is tokenized once, and words are interned
+    so set operations mostly compare by identity.
+    """
+    return frozenset(sys.intern(word) for word in text.lower().split())
+
+
+def batch_metrics(reference_text: str, variants: list) -> dict:
+    """
+    Calculate all similarity metrics of several texts against one reference.
+    
+    The reference and variants are embedded together in one TF-IDF call and
+    all cosine distances come from a single matrix product; the reference is
+    tokenized once for every word-overlap comparison.
+    
+    Args:
+        reference_text: Text to compare against (e.g. ORIGINAL_CLEAN)
+        variants: List of texts to compare with the reference
+        
+    Returns:
+        Dictionary with the embedding dimension and per-variant lists of
+        cosine distances, text similarities and word overlaps
+    """
+    variants = list(variants)
+    embeddings = get_local_embedding([reference_text] + variants)
+    cosine_distances = cosine_distance_matrix(embeddings[0], embeddings[1:])[0]
+    
+    return {
+        "embedding_dimension": embeddings.shape[1],
+        "cosine_distances": [float(d) for d in cosine_distances],
+        "text_similarities": [calculate_text_similarity(reference_text, v) for v in variants],
+        "word_overlaps": [calculate_word_overlap(reference_text, v) for v in variants]
+    }
+
+
 def load_final_outputs() -> dict:
     """
     Load the final English outputs from each noise level experiment.
@@ -154,45 +238,29 @@ def analyze_semantic_drift():
     print(f"Loaded {len(final_outputs)} outputs")
     print()
     
-    # Prepare all texts for embedding
+    # Embed all texts and compute every metric in one batch
     print("Creating local embeddings using TF-IDF...")
-    all_texts = [ORIGINAL_CLEAN] + [final_outputs[n] for n in sorted(final_outputs.keys())]
-    embeddings = get_local_embedding(all_texts)
+    noise_order = sorted(final_outputs.keys())
+    metrics = batch_metrics(ORIGINAL_CLEAN, [final_outputs[n] for n in noise_order])
     
-    original_embedding = embeddings[0]
-    final_embeddings = {noise: embeddings[i+1] for i, noise in enumerate(sorted(final_outputs.keys()))}
-    
-    print(f"Embedding dimension: {len(original_embedding)}")
+    print(f"Embedding dimension: {metrics['embedding_dimension']}")
     print()
     
-    # Calculate distances for each noise level
-    print("Calculating semantic distances...")
+    # Report distances for each noise level
+    print("Semantic distances:")
     print("-" * 70)
     
-    distances = {}
-    text_similarities = {}
-    word_overlaps = {}
+    distances = dict(zip(noise_order, metrics["cosine_distances"]))
+    text_similarities = dict(zip(noise_order, metrics["text_similarities"]))
+    word_overlaps = dict(zip(noise_order, metrics["word_overlaps"]))
     
-    for noise in sorted(final_outputs.keys()):
+    for noise in noise_order:
         final_text = final_outputs[noise]
-        final_embedding = final_embeddings[noise]
-        
-        # Calculate cosine distance (TF-IDF based)
-        distance = calculate_cosine_distance(original_embedding, final_embedding)
-        distances[noise] = distance
-        
-        # Calculate text similarity
-        text_sim = calculate_text_similarity(ORIGINAL_CLEAN, final_text)
-        text_similarities[noise] = text_sim
-        
-        # Calculate word overlap
-        word_overlap = calculate_word_overlap(ORIGINAL_CLEAN, final_text)
-        word_overlaps[noise] = word_overlap
         
         print(f"Noise {noise:2d}%:")
-        print(f"  Cosine Distance:  {distance:.6f}")
-        print(f"  Text Similarity:  {text_sim:.6f}")
-        print(f"  Word Overlap:     {word_overlap:.6f}")
+        print(f"  Cosine Distance:  {distances[noise]:.6f}")
+        print(f"  Text Similarity:  {text_similarities[noise]:.6f}")
+        print(f"  Word Overlap:     {word_overlaps[noise]:.6f}")
         print(f"  Original: {ORIGINAL_CLEAN[:55]}...")
         print(f"  Final:    {final_text[:55]}...")
         print()
@@ -220,14 +288,37 @@ def analyze_semantic_drift():
         "api_provider": "NONE - All local computation"
     }
     
-    with open("analysis_results_local.json", 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    results_json = json.dumps(results, indent=2, ensure_ascii=False)
+    _write_if_changed("analysis_results_local.json", results_json)
     
     print("Results saved to: analysis_results_local.json")
     print("=" * 70)
     print()
 
 
+def _write_if_changed(path: str, content: str) -> bool:
+    """
+    Write content to path as UTF-8 unless the file already holds exactly
+    those bytes.
+    
+    Used for the results JSON so an unchanged re-run leaves that file's
+    mtime alone (the graphs are still rewritten on every run).
+    
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    data = content.encode('utf-8')
+    
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
 def generate_graph(distances: dict, text_similarities: dict, word_overlaps: dict):
     """
     Generate and save graphs showing semantic drift vs noise level.
@@ -237,6 +328,12 @@ def generate_graph(distances: dict, text_similarities: dict, word_overlaps: dict
         text_similarities: Dictionary mapping noise level to text similarity
         word_overlaps: Dictionary mapping noise level to word overlap
     """
+    # Imported here so the metric helpers above can be reused without
+    # paying matplotlib's start-up cost. Graphs are only written to files,
+    # so draw on a standalone Figure instead of going through pyplot: no GUI
+    # backend is set up and the caller's backend and open figures are untouched.
+    from matplotlib.figure import Figure
+    
     # Extract data
     noise_levels = sorted(distances.keys())
     distance_values = [distances[n] for n in noise_levels]
@@ -244,7 +341,8 @@ def generate_graph(distances: dict, text_similarities: dict, word_overlaps: dict
     word_overlap_values = [word_overlaps[n] for n in noise_levels]
     
     # Create figure with subplots
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig = Figure(figsize=(16, 12))
+    axes = fig.subplots(2, 2)
     fig.suptitle('Semantic Drift Analysis - Multi-Agent Translation Pipeline\nEnglish → French → Hebrew → English (Local Analysis - No API)',
                  fontsize=16, fontweight='bold')
     
@@ -323,16 +421,14 @@ def generate_graph(distances: dict, text_similarities: dict, word_overlaps: dict
     ax4.set_xlim(-5, 55)
     ax4.set_xticks(noise_levels)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save figure
-    plt.savefig('semantic_drift_analysis_local.png', dpi=300, bbox_inches='tight')
+    fig.savefig('semantic_drift_analysis_local.png', dpi=300, bbox_inches='tight')
     print("Graph saved to: semantic_drift_analysis_local.png")
     
-    plt.savefig('semantic_drift_analysis_local.pdf', bbox_inches='tight')
+    fig.savefig('semantic_drift_analysis_local.pdf', bbox_inches='tight')
     print("Graph saved to: semantic_drift_analysis_local.pdf")
-    
-    plt.close()
 
 
 def print_summary_statistics(distances: dict, text_sims: dict, word_overlaps: dict):
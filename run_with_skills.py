@@ -18,6 +18,7 @@ Requirements:
 import os
 import sys
 import argparse
+import functools
 from pathlib import Path
 import anthropic
 
@@ -40,18 +41,32 @@ NOISY_INPUTS = {
 
 
 def load_skill(skill_name: str) -> dict:
-    """Load a skill's SKILL.md content."""
+    """
+    Load a skill's SKILL.md content.
+    
+    The file text is cached per skill name, so running every noise level
+    reads each skill file once; each call still gets its own dict. Call
+    load_skill.cache_clear() to pick up edited skills.
+    """
+    return {
+        "name": skill_name,
+        "content": _read_skill_file(skill_name)
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _read_skill_file(skill_name: str) -> str:
+    """Read a skill's SKILL.md text from the skills directory."""
     skill_path = SKILLS_DIR / skill_name / "SKILL.md"
     if not skill_path.exists():
         raise FileNotFoundError(f"Skill not found: {skill_path}")
     
     with open(skill_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    return {
-        "name": skill_name,
-        "content": content
-    }
+        return f.read()
+
+
+# Expose cache clearing on the public loader, as with an lru_cache'd function
+load_skill.cache_clear = _read_skill_file.cache_clear
 
 
 def run_translation_with_skill(client: anthropic.Anthropic, skill_name: str, input_text: str, stage: int) -> str: